@@ -1,2 +1,11 @@
 __all__ = ["main"]
 
+
+def __getattr__(name):
+    # PEP 562: defer importing .cli until main is actually requested, so
+    # `import requestcatcher_wrapper` stays free of the CLI module.
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,46 +1,88 @@
 import argparse
-import asyncio
-import json
 import os
 import random
-import re
 import string
-import subprocess
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Pattern
 
-import websockets
+# Heavy modules (websockets pulls in ssl/http/email, asyncio spins up its
+# machinery) are imported inside the functions that need them, so --help
+# and argument errors stay on the bare argparse startup path.
 
+_ALPHABET = string.ascii_lowercase + string.digits
 
-def generate_prefix(length: int = 8) -> str:
-    alphabet = string.ascii_lowercase + string.digits
-    return "".join(random.choice(alphabet) for _ in range(length))
+# tty/NO_COLOR state is fixed for the process lifetime; decide once here
+# instead of paying an isatty() syscall per message.
+_COLOR_ENABLED = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+_SEP = "=" * 80
+
+_MAX_BODY_LEN = 2000
+_TRUNCATION_MARK = "\n...[truncated]..."
 
+_ANSI_RED = "\033[1;31m"
+_ANSI_RESET = "\033[0m"
+# Backref template keeps re.sub inside the C engine: no Python callback
+# per match.
+_HL_TEMPLATE = _ANSI_RED + r"\g<0>" + _ANSI_RESET
 
-def _supports_color() -> bool:
-    return sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+def generate_prefix(length: int = 8) -> str:
+    return "".join(random.choices(_ALPHABET, k=length))
 
 
-def _highlight_text(text: str, needle: Optional[str]) -> str:
-    if not needle or not _supports_color():
+def _highlight_text(
+    text: str,
+    regex: Optional[Pattern[str]],
+    enable_color: bool = _COLOR_ENABLED,
+) -> str:
+    if regex is None or not enable_color:
         return text
 
-    pattern = re.escape(needle)
-    regex = re.compile(pattern, re.IGNORECASE)
-    start = "\033[1;31m"
-    end = "\033[0m"
-    return regex.sub(lambda m: f"{start}{m.group(0)}{end}", text)
+    # search() stops at the first hit, so when the needle is absent (the
+    # common case) we skip sub() and its replacement-string allocation.
+    if regex.search(text) is None:
+        return text
 
+    return regex.sub(_HL_TEMPLATE, text)
+
+
+# Characters of a well-formed ISO8601 timestamp; anything else falls back
+# to the full datetime round-trip.
+_TIME_CHARS = frozenset("0123456789-:T.+Z")
+
+
+def _normalize_time(time_str: str) -> str:
+    if _TIME_CHARS.issuperset(time_str):
+        # The backend emits ISO8601 ending in Z; rewriting the suffix
+        # matches fromisoformat(...).isoformat() without allocating a
+        # datetime.
+        if time_str.endswith("Z"):
+            return time_str[:-1] + "+00:00"
+        return time_str
+
+    from datetime import datetime
 
-def format_request(req: Dict[str, Any]) -> str:
-    time_str = req.get("time") or ""
     try:
-        if time_str:
-            dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-            time_str = dt.isoformat()
+        return datetime.fromisoformat(time_str.replace("Z", "+00:00")).isoformat()
     except Exception:
-        pass
+        return time_str
+
+
+def _hval(v: Any) -> str:
+    # Header values are lists in the backend model, almost always with a
+    # single string element; specialize for that shape.
+    if type(v) is list:
+        if len(v) == 1:
+            return v[0] if type(v[0]) is str else str(v[0])
+        return ", ".join(v) if all(type(x) is str for x in v) else ", ".join(map(str, v))
+    return str(v)
+
+
+def format_request(req: Dict[str, Any]) -> str:
+    time_str = req.get("time") or ""
+    if time_str:
+        time_str = _normalize_time(time_str)
 
     host = req.get("host", "")
     method = req.get("method", "")
@@ -51,29 +93,54 @@ def format_request(req: Dict[str, Any]) -> str:
     first_line = f"[{time_str}] {method} {path} (host={host}, from={remote}, len={content_length})"
 
     headers = req.get("headers") or {}
-    headers_lines = []
-    for k, v in headers.items():
-        if isinstance(v, list):
-            value_str = ", ".join(str(x) for x in v)
-        else:
-            value_str = str(v)
-        headers_lines.append(f"{k}: {value_str}")
-    headers_block = "\n".join(headers_lines)
+    headers_block = "\n".join(f"{k}: {_hval(v)}" for k, v in headers.items())
 
     body = req.get("body") or ""
-    max_body_len = 2000
-    if len(body) > max_body_len:
-        body = body[:max_body_len] + "\n...[truncated]..."
+    if type(body) is not str:
+        body = str(body)
+    if len(body) > _MAX_BODY_LEN:
+        body = body[:_MAX_BODY_LEN] + _TRUNCATION_MARK
 
-    parts = [first_line]
+    out = first_line
     if headers_block:
-        parts.append("Headers:")
-        parts.append(headers_block)
+        out = f"{out}\nHeaders:\n{headers_block}"
     if body:
-        parts.append("Body:")
-        parts.append(body)
+        out = f"{out}\nBody:\n{body}"
+    return out
 
-    return "\n".join(parts)
+
+async def _writer_loop(
+    queue: "asyncio.Queue",
+    log_fp: Optional[Any],
+    quiet: bool,
+) -> None:
+    import asyncio
+
+    while True:
+        shown, plain = await queue.get()
+        out = [] if shown is None else [shown]
+        logged = [] if plain is None else [plain]
+        # Drain whatever arrived in the same burst so the whole batch goes
+        # out with one write per sink.
+        while True:
+            try:
+                shown, plain = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if shown is not None:
+                out.append(shown)
+            if plain is not None:
+                logged.append(plain)
+        if out and not quiet:
+            # Write the batch as bytes straight to the binary buffer: one
+            # encode per batch instead of a TextIOWrapper encode per call.
+            sys.stdout.buffer.write("".join(out).encode("utf-8", errors="replace"))
+            sys.stdout.buffer.flush()
+        if logged and log_fp:
+            # One flush per drained burst keeps tail -f live and bounds
+            # what a SIGTERM (the documented kill) can discard.
+            log_fp.write("".join(logged))
+            log_fp.flush()
 
 
 async def watch_catcher(
@@ -82,17 +149,45 @@ async def watch_catcher(
     log_file: Optional[str] = None,
     quiet: bool = False,
 ) -> None:
+    import asyncio
+    import re
+
+    import websockets
+
+    try:
+        # orjson is several times faster than stdlib json on large
+        # payloads and accepts bytes frames directly without a UTF-8
+        # decode first.
+        import orjson as _json
+    except ImportError:
+        import json as _json
+
     url = f"wss://{prefix}.requestcatcher.com/init-client"
 
+    # Highlighting only ever shows on a color-capable stdout; without
+    # color the plain block is reused as-is.
+    hl_re = (
+        re.compile(re.escape(highlight), re.IGNORECASE)
+        if highlight and _COLOR_ENABLED
+        else None
+    )
+
     log_fp = None
     if log_file:
-        log_fp = open(log_file, "a", encoding="utf-8")
+        # Let the io stack batch writes between the explicit per-burst
+        # flushes in the writer task.
+        log_fp = open(log_file, "a", encoding="utf-8", buffering=8192)
 
     def _stdout(line: str) -> None:
+        # Status lines are rare; flush so they never trail the request
+        # blocks the writer task emits via sys.stdout.buffer.
         if not quiet:
-            print(line)
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
 
     def _log(line: str) -> None:
+        # Status lines are rare; flush so a tail -f reader sees them
+        # (including the startup banner) immediately.
         if log_fp:
             log_fp.write(line + "\n")
             log_fp.flush()
@@ -104,37 +199,96 @@ async def watch_catcher(
     _both(f"Listening on https://{prefix}.requestcatcher.com/")
     _both(f"Connecting to {url} for live requests...\n")
 
-    while True:
-        try:
-            async with websockets.connect(url) as ws:
+    # Request blocks go through a bounded queue to a dedicated writer task
+    # so slow tty/disk writes don't back-pressure the websocket reader.
+    queue: "asyncio.Queue" = asyncio.Queue(maxsize=256)
+    writer_task = asyncio.create_task(_writer_loop(queue, log_fp, quiet))
+
+    # Quiet mode without a log file has no consumer for request details;
+    # skip parsing/formatting entirely in that case.
+    needs_format = not quiet or log_fp is not None
+
+    try:
+        # connect() used as an async iterator reconnects with the
+        # library's own backoff, replacing hand-rolled retry plumbing.
+        # No compression: the backend doesn't negotiate it, and skipping
+        # the extension avoids a per-frame inflate pass. Frames are handed
+        # to the JSON decoder as-is (orjson consumes bytes directly, no
+        # str materialization).
+        async for ws in websockets.connect(
+            url,
+            ping_interval=20,
+            ping_timeout=20,
+            compression=None,
+            max_size=2**22,
+        ):
+            try:
                 _both("Connected. Waiting for requests...\n")
                 async for message in ws:
+                    if not needs_format:
+                        continue
                     try:
-                        data = json.loads(message)
-                    except json.JSONDecodeError:
+                        data = _json.loads(message)
+                    except ValueError:
+                        data = None
+
+                    # Frames that aren't the expected request object — bad
+                    # JSON, but also valid JSON like a bare "ping" string —
+                    # are shown raw instead of crashing the worker.
+                    if not isinstance(data, dict):
+                        if isinstance(message, bytes):
+                            message = message.decode("utf-8", errors="replace")
                         _both(f"[raw] {message}")
                         continue
 
-                    plain = format_request(data)
-                    block = "=" * 80 + "\n" + plain + "\n" + "=" * 80 + "\n"
-
-                    highlighted = _highlight_text(block, highlight)
-                    _stdout(highlighted)
-                    _log(block.rstrip("\n"))
-        except (KeyboardInterrupt, asyncio.CancelledError):
-            _stdout("\nInterrupted, exiting.")
-            _log("Interrupted, exiting.")
-            break
-        except Exception as exc:
-            msg = f"Connection error: {exc!r}"
-            _stdout(msg)
-            _log(msg)
-            retry = "Reconnecting in 3 seconds...\n"
-            _stdout(retry)
-            _log(retry.strip())
-            await asyncio.sleep(3)
-    if log_fp:
-        log_fp.close()
+                    # Truncate huge bodies right after the parse so the
+                    # formatter and queue only ever hold the display
+                    # prefix, not the full payload.
+                    body = data.get("body")
+                    if isinstance(body, str) and len(body) > _MAX_BODY_LEN:
+                        data["body"] = body[:_MAX_BODY_LEN] + _TRUNCATION_MARK
+
+                    plain = plain_block = shown_block = None
+                    if log_fp:
+                        plain = format_request(data)
+                        plain_block = f"{_SEP}\n{plain}\n{_SEP}\n"
+                    if not quiet:
+                        # Format once, then one regex pass over the
+                        # assembled text — the same highlight surface
+                        # whether or not a log file is in play.
+                        shown = plain if plain is not None else format_request(data)
+                        if hl_re is not None:
+                            shown = _highlight_text(shown, hl_re)
+                        # Block plus trailing blank line.
+                        shown_block = f"{_SEP}\n{shown}\n{_SEP}\n\n"
+                    if plain_block is not None or shown_block is not None:
+                        await queue.put((shown_block, plain_block))
+            except websockets.ConnectionClosed as exc:
+                msg = f"Connection closed: {exc!r}; reconnecting..."
+                _stdout(msg)
+                _log(msg)
+                continue
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        _stdout("\nInterrupted, exiting.")
+        _log("Interrupted, exiting.")
+    finally:
+        writer_task.cancel()
+        try:
+            await writer_task
+        except asyncio.CancelledError:
+            pass
+        # Flush anything still queued when the writer was cancelled.
+        while True:
+            try:
+                shown, plain = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if shown is not None and not quiet:
+                sys.stdout.write(shown)
+            if plain is not None and log_fp:
+                log_fp.write(plain)
+        if log_fp:
+            log_fp.close()
 
 
 def parse_args(argv=None) -> argparse.Namespace:
@@ -191,6 +345,8 @@ def main(argv=None) -> None:
     # Internal worker: actually runs the watcher in the foreground and logs to file,
     # without spawning further children.
     if args.worker:
+        import asyncio
+
         if args.background and not log_file:
             log_file = f"rcw-{prefix}.log"
         try:
@@ -208,6 +364,8 @@ def main(argv=None) -> None:
 
     # User-facing background mode: spawn a detached worker process and exit quickly.
     if args.background:
+        import subprocess
+
         if not log_file:
             log_file = f"rcw-{prefix}.log"
 
@@ -244,6 +402,8 @@ def main(argv=None) -> None:
         print(f"Process PID: {proc.pid}  (stop with: kill {proc.pid})")
         return
 
+    import asyncio
+
     try:
         asyncio.run(
             watch_catcher(